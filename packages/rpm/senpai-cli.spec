@@ -27,11 +27,11 @@ BuildArch:      noarch
 
 BuildRequires:  python3-devel
 BuildRequires:  python3-setuptools
-BuildRequires:  python3-requests
-BuildRequires:  python3-toml
 
-Requires:       python3-requests
-Requires:       python3-toml
+Requires:       python3-aiohttp
+Requires:       python3-tomli-w
+Recommends:     python3-orjson
+Recommends:     python3-uvloop
 
 %description
 BashSenpai is a terminal assistant powered by ChatGPT that transforms instructions into ready-to-use commands.
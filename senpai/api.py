@@ -12,13 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
-from requests import post as POST, Response
-from typing import Optional, Union
+import aiohttp
+import gzip
+import json
+from typing import AsyncIterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib parser works the same here
+    orjson = None
 
 from .data.config import Config
 from .data.history import History
 
+# constant request headers for the pre-serialized payload paths
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_GZIP_JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Content-Encoding': 'gzip',
+}
+
+# constant error payload shared by the unauthenticated paths
+_AUTH_ERROR = {
+    'error': True,
+    'type': 'auth',
+    'message': 'You are not authenticated',
+}
+
 
 class API:
     """
@@ -27,16 +47,23 @@ class API:
     It encapsulates methods for user authentication and sending/receiving
     queries to/from the API server.
 
+    A single aiohttp session is kept for the lifetime of the object, so the
+    connection pool and keep-alive are shared between consecutive calls.
+
     Attributes:
         HOST: An URL to the BashSenpai API server.
         _config: A Config object storing the user settings.
         _history: A History object to maintain the log of user interactions.
+        _session: An aiohttp ClientSession shared by all API calls.
+        _base: The constant part of the request payload, rebuilt only when the
+            relevant config values change.
 
     Usage:
         >>> api = API(config=config, history=history)
-        >>> api.login('<your_auth_token>')
-        >>> response = api.question('how do I create a new directory')
-        >>> response = api.explain('ffmpeg')
+        >>> await api.login('<your_auth_token>')
+        >>> response = await api.question('how do I create a new directory')
+        >>> response = await api.explain('ffmpeg')
+        >>> await api.aclose()
     """
 
     # HOST = 'http://localhost:8000/v1'
@@ -54,8 +81,119 @@ class API:
         """
         self._config = config
         self._history = history
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+            headers={'User-Agent': 'bashsenpai'},
+            # bound how long a stalled server can hang the CLI: the answer
+            # itself streams for a while, so only cap connect and the gap
+            # between reads rather than the total request time
+            timeout=aiohttp.ClientTimeout(connect=5, sock_read=60),
+        )
+
+        # pre-bind the endpoint URLs
+        self._auth_url = f'{self.HOST}/auth/'
+        self._explain_url = f'{self.HOST}/explain/'
+        self._prompt_url = f'{self.HOST}/prompt/'
+
+        self.refresh()
 
-    async def explain(self, command: str) -> Union[Response, dict[str, str]]:
+    def refresh(self) -> None:
+        """
+        Rebuilds the constant part of the request payload from the config.
+
+        Call after changing the `token`, `version` or `persona` settings so
+        subsequent API calls pick up the new values.
+        """
+        self._base = {
+            'token': self._config.get_value('token'),
+            'version': self._config.get_value('version'),
+            'persona': self._config.get_value('persona'),
+        }
+
+    async def __aenter__(self) -> 'API':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        if not self._session.closed:
+            await self._session.close()
+
+    async def _post(
+            self,
+            url: str,
+            payload: dict,
+        ) -> aiohttp.ClientResponse:
+        """
+        Sends a POST request with a JSON payload.
+
+        The body is pre-serialized with orjson when available, bypassing the
+        slower stdlib encoder aiohttp uses for its json= argument. Larger
+        payloads (a question plus several history prompts) are gzipped to cut
+        the bytes on the wire.
+
+        Args:
+            url (str): The endpoint URL.
+            payload (dict): The request payload.
+
+        Returns:
+            aiohttp.ClientResponse: The response object.
+        """
+        if orjson is not None:
+            body = orjson.dumps(payload)
+            if len(body) > 1024:
+                return await self._session.post(
+                    url, data=gzip.compress(body, compresslevel=1),
+                    headers=_GZIP_JSON_HEADERS,
+                )
+            return await self._session.post(
+                url, data=body, headers=_JSON_HEADERS,
+            )
+        return await self._session.post(url, json=payload)
+
+    async def _stream_response(
+            self,
+            response: aiohttp.ClientResponse,
+        ) -> AsyncIterator[dict]:
+        """
+        Yields the JSON documents streamed in the response body, one per line.
+
+        Parsing happens while the rest of the stream is still in flight, and
+        the pooled connection is released back to the session once the stream
+        is exhausted or the consumer stops iterating.
+
+        Args:
+            response (aiohttp.ClientResponse): The streamed API response.
+
+        Yields:
+            dict: A single parsed chunk of the response.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        buf = bytearray()
+        try:
+            # read in large chunks and split the buffer on newlines, instead
+            # of paying a readline call per streamed line
+            async for data in response.content.iter_chunked(65536):
+                buf.extend(data)
+                while (pos := buf.find(b'\n')) >= 0:
+                    line = bytes(buf[:pos]).strip()
+                    del buf[:pos + 1]
+                    if line:
+                        yield loads(line)
+
+            # flush a possible unterminated trailing line
+            tail = bytes(buf).strip()
+            if tail:
+                yield loads(tail)
+        finally:
+            response.release()
+
+    async def explain(
+            self,
+            command: str,
+        ) -> Union[AsyncIterator[dict], dict[str, str]]:
         """
         Explains the given command by querying the BashSenpai API.
 
@@ -63,32 +201,22 @@ class API:
             command (str): The command to be explained.
 
         Returns:
-            Resonse | dict: The API response or an error message if the user is
-                not authenticated or if an unknown server error occurs.
+            AsyncIterator | dict: A stream of parsed response chunks or an
+                error message if the user is not authenticated or if an
+                unknown server error occurs.
 
         Raises:
             Exception: In case of server communication issues or other errors.
         """
         # check if the user is authenticated first
-        token = self._config.get_value('token')
-        if not token:
-            return {
-                'error': True,
-                'type': 'auth',
-                'message': 'You are not authenticated',
-            }
+        if not self._base['token']:
+            return _AUTH_ERROR
 
         # send the question to our API
         try:
-            data = {
-                'token': token,
-                'version': self._config.get_value('version'),
-                'persona': self._config.get_value('persona'),
-                'question': command,
-            }
-            return await asyncio.to_thread(
-                POST, f'{self.HOST}/explain/', json=data, stream=True,
-            )
+            data = {**self._base, 'question': command}
+            response = await self._post(self._explain_url, data)
+            return self._stream_response(response)
         except Exception as e:
             return {
                 'error': True,
@@ -111,14 +239,17 @@ class API:
         data = {
             'token': token,
         }
-        response = await asyncio.to_thread(POST, f'{self.HOST}/auth/', json=data)
-        return response.json()
+        response = await self._post(self._auth_url, data)
+        async with response:
+            if orjson is not None:
+                return await response.json(loads=orjson.loads)
+            return await response.json()
 
     async def question(
             self,
             question: str,
             metadata: Optional[dict[str, str]] = None,
-        ) -> Union[Response, dict[str, str]]:
+        ) -> Union[AsyncIterator[dict], dict[str, str]]:
         """
         Sends a question to the BashSenpai API server and returns the response.
 
@@ -128,34 +259,26 @@ class API:
                 user environment metadata.
 
         Returns:
-            Resonse | dict: Response received from the API server containing the
-                answer to the question or an error message.
+            AsyncIterator | dict: A stream of parsed response chunks
+                containing the answer to the question, or an error message.
 
         Raises:
             Exception: In case of server communication issues or other errors.
         """
         # check if the user is authenticated first
-        token = self._config.get_value('token')
-        if not token:
-            return {
-                'error': True,
-                'type': 'auth',
-                'message': 'You are not authenticated',
-            }
+        if not self._base['token']:
+            return _AUTH_ERROR
 
         # send the question to our API
         try:
             data = {
-                'token': token,
-                'version': self._config.get_value('version'),
-                'persona': self._config.get_value('persona'),
+                **self._base,
                 'question': question,
                 'history': self._history.get_history(),
                 'metadata': metadata,
             }
-            return await asyncio.to_thread(
-                POST, f'{self.HOST}/prompt/', json=data, stream=True,
-            )
+            response = await self._post(self._prompt_url, data)
+            return self._stream_response(response)
         except Exception as e:
             return {
                 'error': True,
@@ -13,9 +13,14 @@
 # limitations under the License.
 
 from pathlib import Path
-import toml
+import tomli_w
 from typing import Union
 
+try:
+    import tomllib
+except ImportError:  # python 3.10 and older
+    import tomli as tomllib
+
 
 class Config:
     """
@@ -24,9 +29,12 @@ class Config:
     It loads the user's config file in TOML format, allows getting and setting
     specific configuration values, and writing the updated configuration file.
 
+    Each setting is stored as a plain attribute on the object, so lookups
+    avoid any dict hashing or key normalization.
+
     Attributes:
         path (Path): The path to the user configuration file.
-        _config (dict): The dictionary holding the current configuration values.
+        _dirty (bool): Whether a setting changed since the last write.
 
     Usage:
         >>> config = Config(path=Path('/path/to/config'))
@@ -35,6 +43,11 @@ class Config:
         >>> config.write()
     """
 
+    __slots__ = (
+        'path', 'token', 'persona', 'prog', 'version',
+        'command_color', 'comment_color', 'execute', 'metadata', '_dirty',
+    )
+
     def __init__(self, path: Path) -> None:
         """
         Initialize the Config object with the provided configuration file path.
@@ -50,29 +63,32 @@ class Config:
         """
         Load the configuration file and set the configuration values.
 
-        If the file doesn't exist, creates a new dictionary with default values.
+        If the file doesn't exist, uses the default values.
         """
         try:
-            with open(self.path, 'r') as f:
-                config = toml.load(f)
+            with open(self.path, 'rb') as f:
+                config = tomllib.load(f)
         except FileNotFoundError:
             config = {'main': {}}
 
-        self._config = {
-            'TOKEN': config['main'].get('token', None),
-            'PERSONA': config['main'].get('persona', 'default'),
-            'PROG': config['main'].get('prog', 'senpai'),
-            'VERSION': config['main'].get('version', '0'),
-            'COMMAND_COLOR': config['main'].get('command_color', 'bold bright blue'),
-            'COMMENT_COLOR': config['main'].get('comment_color', 'bright gray'),
-            'EXECUTE': config['main'].get('execute', True),
-            'METADATA': config['main'].get('metadata', True),
-        }
+        main = config['main']
+        self.token = main.get('token', None)
+        self.persona = main.get('persona', 'default')
+        self.prog = main.get('prog', 'senpai')
+        self.version = main.get('version', '0')
+        self.command_color = main.get('command_color', 'bold bright blue')
+        self.comment_color = main.get('comment_color', 'bright gray')
+        self.execute = main.get('execute', True)
+        self.metadata = main.get('metadata', True)
+        self._dirty = False
 
     def get_value(self, setting: str) -> Union[str, None]:
         """
         Get the value of a specific configuration setting.
 
+        Settings are addressed by their exact lowercase name; every call site
+        passes a fixed literal, so no case normalization happens here.
+
         Args:
             setting (str): The name of the configuration setting.
 
@@ -80,36 +96,49 @@ class Config:
             str or None: The value of the configuration setting, or None if
             not found.
         """
-        return self._config.get(setting.upper(), None)
+        return getattr(self, setting, None)
 
     def set_value(self, setting: str, value: Union[str, bool]) -> None:
         """
         Set the value of a specific configuration setting.
 
+        The config is only marked dirty when the value actually changes, so
+        the steady-state invocation never rewrites the file.
+
         Args:
             setting (str): The name of the configuration setting.
             value (str | bool): The new value for the configuration setting.
         """
-        self._config[setting.upper()] = value
+        if getattr(self, setting, None) != value:
+            setattr(self, setting, value)
+            self._dirty = True
 
     def write(self) -> None:
         """
         Write the current configuration values to the user config file.
 
         The config file is stored in TOML format. If a configuration file does
-        not exist, a new one is created.
+        not exist, a new one is created. Writing is skipped when no setting has
+        changed since the last write.
         """
-        with open(self.path, 'w') as f:
-            config_data = {
-                'main': {
-                    'token': self._config['TOKEN'],
-                    'persona': self._config['PERSONA'],
-                    'prog': self._config['PROG'],
-                    'version': self._config['VERSION'],
-                    'command_color': self._config['COMMAND_COLOR'],
-                    'comment_color': self._config['COMMENT_COLOR'],
-                    'execute': self._config['EXECUTE'],
-                    'metadata': self._config['METADATA'],
-                }
-            }
-            toml.dump(config_data, f)
+        if not self._dirty:
+            return
+
+        settings = {
+            'token': self.token,
+            'persona': self.persona,
+            'prog': self.prog,
+            'version': self.version,
+            'command_color': self.command_color,
+            'comment_color': self.comment_color,
+            'execute': self.execute,
+            'metadata': self.metadata,
+        }
+        with open(self.path, 'wb') as f:
+            # TOML has no null; unset values (e.g. the token before login)
+            # are omitted and pick up their defaults again on the next load
+            tomli_w.dump({'main': {
+                key: value for key, value in settings.items()
+                if value is not None
+            }}, f)
+        self._dirty = False
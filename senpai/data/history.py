@@ -14,9 +14,15 @@
 
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib parser works the same here
+    orjson = None
+
 
 # time delta in seconds after which the history is skipped
 DELTA_HISTORY = 7 * 60 * 60
@@ -34,6 +40,9 @@ class History:
     Attributes:
         path (Path): Path to the JSON file storing the history.
         _history (List[Dict[str, Union[str, List[Any]]]]): Loaded history data.
+        _dirty (bool): Whether the history changed since the last write.
+        _recent (list | None): Cached result of get_history(), invalidated
+            whenever the history mutates.
 
     Usage:
         >>> history = History(path=Path('/path/to/history'))
@@ -62,9 +71,17 @@ class History:
         If the history file does not exist, initialize an empty history.
         """
         self._history = list()
+        self._dirty = False
+        self._recent = None
         if self.path.exists():
-            with open(self.path, 'r') as f:
-                self._history = json.load(f)
+            with open(self.path, 'rb') as f:
+                if orjson is not None:
+                    self._history = orjson.loads(f.read())
+                else:
+                    self._history = json.load(f)
+            # truncate up front so the conversion below and the in-memory
+            # footprint stay bounded even if the file grew externally
+            self._history = self._history[-4:]
 
         # convert old json history
         for idx, history_message in enumerate(self._history):
@@ -77,6 +94,7 @@ class History:
                     elif line_type == 'command':
                         answer += '$ ' + line['data'] + '\n'
                 self._history[idx]['answer'] = answer.strip()
+                self._dirty = True
             if isinstance(history_message.get('persona'), list):
                 answer = ''
                 for line in history_message['persona']:
@@ -86,6 +104,9 @@ class History:
                     elif line_type == 'command':
                         answer += '$ ' + line['data'] + '\n'
                 self._history[idx]['persona'] = answer.strip() or None
+                self._dirty = True
+
+        # persist the converted format only when something actually changed
         self.write()
 
 
@@ -98,10 +119,14 @@ class History:
                 the history.
         """
         self._history.append(prompt)
+        self._dirty = True
+        self._recent = None
 
     def clear(self) -> None:
         """Clear the previous user history."""
         self._history = list()
+        self._dirty = True
+        self._recent = None
 
     def get_history(self) -> List[Union[Dict[str, str], Any]]:
         """
@@ -111,17 +136,32 @@ class History:
             List[Dict[str, Union[str, List[Any]]]]: The current user's
                 interaction history.
         """
-        now = datetime.now().timestamp()
-        return list(filter(
-            lambda x: now - x.get('timestamp', 0) < DELTA_HISTORY,
-            self._history,
-        ))
+        if self._recent is None:
+            now = datetime.now().timestamp()
+            self._recent = list(filter(
+                lambda x: now - x.get('timestamp', 0) < DELTA_HISTORY,
+                self._history,
+            ))
+        return self._recent
 
     def write(self) -> None:
         """
         Writes the current user history to the history log file.
-        Only the latest 5 prompts are kept.
+        Only the latest 5 prompts are kept. Skipped entirely when the history
+        hasn't changed since the last write.
         """
-        with open(self.path, 'w') as f:
-            # limit to latest 4 prompts only
-            json.dump(self._history[-4:], f)
+        if not self._dirty:
+            return
+
+        # limit to latest 4 prompts only; write to a temporary file and swap
+        # it in place so an interrupted exit can't truncate the history
+        tmp_path = self.path.with_suffix('.json.tmp')
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self._history[-4:]))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._history[-4:], f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
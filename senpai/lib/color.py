@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 import sys
 
 # Dictionary of all 4-bit ANSI colors
@@ -27,7 +28,8 @@ COLOR = {
     'cyan':    ('36', '96'),
 }
 
-def parse_color(color: str) -> str:
+@lru_cache(maxsize=32)
+def _parse_color(color: str) -> str:
     """
     Convert a color name to an ANSI-formatted string.
 
@@ -42,6 +44,12 @@ def parse_color(color: str) -> str:
             escape sequences for changing the color of text on ANSI-compliant
             terminals. The returned string follows the format
             '\x1B[<color-code>m', where <color-code> is an ANSI color code.
+            The result is cached per color name, so repeat calls for the same
+            configured color skip the parsing entirely.
+
+    Note:
+        Prefer the public parse_color wrapper, which resolves the canonical
+        spellings from a precomputed table.
 
     Note:
         If the system platform is either 'win32' or 'cygwin', the returned
@@ -59,3 +67,30 @@ def parse_color(color: str) -> str:
                 color = color.replace('\1', '').replace('\2', '')
 
             return color
+
+
+# all canonical color spellings, resolved once at import; anything else
+# (e.g. a different word order) falls through to the parser above
+_TABLE = {
+    spelling: _parse_color(spelling)
+    for name in COLOR
+    for spelling in (
+        name, f'bright {name}', f'bold {name}', f'bold bright {name}',
+    )
+}
+
+
+def parse_color(color: str) -> str:
+    """
+    Convert a color name to an ANSI-formatted string.
+
+    Canonical spellings ('bold bright blue', 'bright gray', ...) hit a table
+    built at import time; see _parse_color for the full grammar.
+
+    Args:
+        color (str): The name of the color to be parsed.
+
+    Returns:
+        str: ANSI-formatted string representing the color.
+    """
+    return _TABLE.get(color) or _parse_color(color)
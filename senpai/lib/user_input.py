@@ -30,11 +30,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from contextlib import contextmanager
+import os
 import sys
 
 if sys.platform in ('win32', 'cygwin'):
     import msvcrt
-    import win32console
 else:
     try:
         import gnureadline as readline  # macos
@@ -42,6 +43,22 @@ else:
         import readline  # linux
     import termios
 
+    # the local-mode flags cleared for raw mode, assembled once
+    _RAW_LFLAGS = ~(
+        termios.ICANON | termios.ECHO | termios.IGNBRK | termios.BRKINT
+    )
+
+
+# hot-path key constants, hoisted to module scope to avoid attribute lookups
+_CTRL_C = '\x03'
+_ESC = '\x1B'
+_WIN_ESC_PREFIXES = frozenset('\x00\xE0')
+
+# escape-sequence continuation bytes, precomputed for O(1) membership checks
+_ESC_L2 = frozenset('\x4F\x5B')
+_ESC_L3 = frozenset('\x31\x32\x33\x35\x36')
+_ESC_L4 = frozenset('\x30\x31\x33\x34\x35\x37\x38\x39')
+
 
 class BASE_KEYS:
     """Base key codes."""
@@ -65,10 +82,33 @@ else:  # linux, macos
         ENTER = '\x0A'
 
 
-def readchar() -> str:
+@contextmanager
+def _raw_mode(fd: int):
+    """
+    Puts the terminal in raw mode for the duration of the context.
+
+    Entering raw mode once around a whole key sequence avoids paying the
+    termios syscalls for every single byte read.
+
+    Args:
+        fd (int): The file descriptor of the input terminal.
+    """
+    old_settings = termios.tcgetattr(fd)
+    term = termios.tcgetattr(fd)
+    try:
+        term[3] &= _RAW_LFLAGS
+        termios.tcsetattr(fd, termios.TCSAFLUSH, term)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def _readchar_raw() -> str:
     """
     Reads a single character from the standard input.
 
+    On POSIX systems the terminal is expected to already be in raw mode.
+
     Returns:
         str: The character read from the standard input.
     """
@@ -77,17 +117,25 @@ def readchar() -> str:
         # manual byte decoding as some bytes in windows are not utf-8 encodable
         return chr(int.from_bytes(msvcrt.getch(), 'big'))
 
+    # handle for linux and macos; read the raw byte directly to skip the
+    # TextIOWrapper codec machinery, key bytes are always single-byte codes
+    return os.read(sys.stdin.fileno(), 1).decode('latin-1')
+
+
+def readchar() -> str:
+    """
+    Reads a single character from the standard input.
+
+    Returns:
+        str: The character read from the standard input.
+    """
+    # handle for windows
+    if sys.platform in ('win32', 'cygwin'):
+        return _readchar_raw()
+
     # handle for linux and macos
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    term = termios.tcgetattr(fd)
-    try:
-        term[3] &= ~(termios.ICANON | termios.ECHO | termios.IGNBRK | termios.BRKINT)
-        termios.tcsetattr(fd, termios.TCSAFLUSH, term)
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+    with _raw_mode(sys.stdin.fileno()):
+        return _readchar_raw()
 
 
 def readinput(prompt: str, default: str) -> str:
@@ -104,6 +152,9 @@ def readinput(prompt: str, default: str) -> str:
     """
     # handle windows
     if sys.platform in ('win32', 'cygwin'):
+        # deferred as it's only needed once the user edits a command
+        import win32console
+
         _stdin = win32console.GetStdHandle(win32console.STD_INPUT_HANDLE)
 
         keys = []
@@ -136,36 +187,40 @@ def readkey() -> str:
     Returns:
         str: The key sequence read from the standard input.
     """
-    c1 = readchar()
-
-    if c1 == BASE_KEYS.CTRL_C:
-        raise KeyboardInterrupt
-
     # handle for windows
     if sys.platform in ('win32', 'cygwin'):
+        c1 = _readchar_raw()
+        if c1 == _CTRL_C:
+            raise KeyboardInterrupt
+
         # if it is a normal character:
-        if c1 not in '\x00\xE0':
+        if c1 not in _WIN_ESC_PREFIXES:
             return c1
 
         # if it is a scpeal key, read second half:
-        ch2 = readchar()
+        ch2 = _readchar_raw()
         return '\x00' + ch2
 
-    # handle for linux and macos
-    if c1 != '\x1B':
-        return c1
+    # handle for linux and macos; enter raw mode once for the whole sequence
+    with _raw_mode(sys.stdin.fileno()):
+        c1 = _readchar_raw()
+        if c1 == _CTRL_C:
+            raise KeyboardInterrupt
+
+        if c1 != _ESC:
+            return c1
 
-    c2 = readchar()
-    if c2 not in '\x4F\x5B':
-        return c1 + c2
+        c2 = _readchar_raw()
+        if c2 not in _ESC_L2:
+            return c1 + c2
 
-    c3 = readchar()
-    if c3 not in '\x31\x32\x33\x35\x36':
-        return c1 + c2 + c3
+        c3 = _readchar_raw()
+        if c3 not in _ESC_L3:
+            return c1 + c2 + c3
 
-    c4 = readchar()
-    if c4 not in '\x30\x31\x33\x34\x35\x37\x38\x39':
-        return c1 + c2 + c3 + c4
+        c4 = _readchar_raw()
+        if c4 not in _ESC_L4:
+            return c1 + c2 + c3 + c4
 
-    c5 = readchar()
-    return c1 + c2 + c3 + c4 + c5
+        c5 = _readchar_raw()
+        return c1 + c2 + c3 + c4 + c5
@@ -19,11 +19,40 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
 import argparse
+from functools import lru_cache
 import sys
+from typing import Optional
 
-from .senpai import BashSenpai
+
+PROG = 'senpai'
+
+# tokens accepted by the --command-color/--comment-color options
+COLOR_TOKENS = frozenset((
+    'bold', 'bright', 'black', 'white', 'gray', 'red',
+    'green', 'yellow', 'blue', 'magenta', 'cyan',
+))
+
+
+def parse_color_arg(argv: list[str]) -> str:
+    """
+    Joins and validates a color option passed on the command line.
+
+    Args:
+        argv (list[str]): The raw option values collected by argparse.
+
+    Returns:
+        str: The normalized color name.
+
+    Raises:
+        SystemExit: If the color contains an unknown token.
+    """
+    color = ' '.join(argv).lower().replace('grey', 'gray')
+    invalid = set(color.split()) - COLOR_TOKENS
+    if invalid:
+        print(f'Error! Can\'t parse "{next(iter(invalid))}".')
+        raise SystemExit(1)
+    return color
 
 
 class SimpleNargsFormatter(argparse.RawDescriptionHelpFormatter):
@@ -52,10 +81,13 @@ class SimpleNargsFormatter(argparse.RawDescriptionHelpFormatter):
         return '%s' % get_metavar(1)
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """
     Get the current version of the application from __init__.py.
 
+    The result is cached, so repeated calls skip the sys.modules lookup.
+
     The version is retrieved by importing the __version__ attribute from the
     __init__.py file.
 
@@ -66,30 +98,23 @@ def get_version() -> str:
     return __version__
 
 
-async def run():
+def build_parser() -> argparse.ArgumentParser:
     """
-    Entry point of the BashSenpai command-line interface.
+    Builds the full argparse parser for the CLI.
 
-    This function initializes the BashSenpai object, parses the provided
-    command-line arguments, validates and sets the appropriate configurations
-    based on the arguments, and handles any provided prompt.
+    Only used on the slow path (--help, --version and malformed arguments);
+    ordinary invocations are handled by the hand-rolled fast parser.
 
-    Raises:
-        SystemExit: If an error occurs while parsing the command line arguments
-            or setting configurations.
+    Returns:
+        argparse.ArgumentParser: The configured argument parser.
     """
-
-    # initialize bash senpai
-    senpai = BashSenpai()
-
-    # parse any command-line arguments
     parser = argparse.ArgumentParser(
-        prog='senpai',
+        prog=PROG,
         usage='%(prog)s [options] prompt',
         description='BashSenpai command-line interface.',
         epilog='\n'.join([
             'colors:',
-            '  black, white, gray, red, greeen, yellow, blue, magenta and cyan',
+            '  black, white, gray, red, green, yellow, blue, magenta and cyan',
             '  There are also brighter versions of each color, for example: "bright blue"',
             '  You can also make colors bold, for example: "bold red" or "bold bright cyan"',
             '',
@@ -110,14 +135,14 @@ async def run():
         formatter_class=SimpleNargsFormatter,
     )
 
-    action = parser.add_argument(
+    parser.add_argument(
         '-n', '--new',
-        action=argparse.BooleanOptionalAction,
+        action='store_true',
+        default=None,
         help='ignore previous history when sending a question',
     )
-    action.option_strings.remove('--no-new')
 
-    action = parser.add_argument(
+    parser.add_argument(
         '--command-color',
         type=str,
         metavar='col',
@@ -126,7 +151,7 @@ async def run():
              'section for a list of all available options',
     )
 
-    action = parser.add_argument(
+    parser.add_argument(
         '--comment-color',
         type=str,
         metavar='col',
@@ -134,17 +159,15 @@ async def run():
         help='set color for the comments',
     )
 
-    action = parser.add_argument(
+    parser.add_argument(
         '--meta',
         action=argparse.BooleanOptionalAction,
-        default=senpai.config.get_value('metadata'),
-        help='send information about your OS to imporove the responses',
+        help='send information about your OS to improve the responses',
     )
 
-    action = parser.add_argument(
+    parser.add_argument(
         '--run',
         action=argparse.BooleanOptionalAction,
-        default=senpai.config.get_value('execute'),
         help='show menu prompt to execute each returned command',
     )
 
@@ -164,101 +187,178 @@ async def run():
         help='ask a question or execute a special command',
     )
 
+    return parser
+
+
+def fast_parse(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Hand-rolled argument parser for the common CLI invocations.
+
+    The grammar of the tool is narrow enough to parse with a simple scan,
+    which reaches the network call much sooner than instantiating a full
+    ArgumentParser.
+
+    Args:
+        argv (list[str]): The command-line arguments, without the program
+            name.
+
+    Returns:
+        argparse.Namespace or None: The parsed arguments, or None when the
+            arguments need the argparse slow path (--help, --version or a
+            malformed option).
+    """
+    args = argparse.Namespace(
+        new=None,
+        command_color=None,
+        comment_color=None,
+        meta=None,
+        run=None,
+        prompt=[],
+    )
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-n', '--new'):
+            args.new = True
+        elif arg == '--meta':
+            args.meta = True
+        elif arg == '--no-meta':
+            args.meta = False
+        elif arg == '--run':
+            args.run = True
+        elif arg == '--no-run':
+            args.run = False
+        elif arg in ('--command-color', '--comment-color'):
+            values = []
+            while i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+                i += 1
+                values.append(argv[i])
+            if not values:
+                return None  # let argparse report the missing value
+            setattr(args, arg[2:].replace('-', '_'), values)
+        elif arg.startswith('-') and arg != '-':
+            return None  # --help/--version or an unknown option
+        else:
+            args.prompt.append(arg)
+        i += 1
+
+    return args
+
+
+async def run():
+    """
+    Entry point of the BashSenpai command-line interface.
+
+    This function initializes the BashSenpai object, parses the provided
+    command-line arguments, validates and sets the appropriate configurations
+    based on the arguments, and handles any provided prompt.
+
+    Raises:
+        SystemExit: If an error occurs while parsing the command line arguments
+            or setting configurations.
+    """
+
     # check for empty arguments first
     if len(sys.argv) < 2:
         print('Error! No arguments provided. For list of available options, run:')
-        print(f'{parser.prog} --help')
+        print(f'{PROG} --help')
         raise SystemExit(1)
 
-    # parse the arguments
-    args = parser.parse_args()
+    # short-circuit the version check before any parser or config work
+    if any(arg in ('-v', '--version') for arg in sys.argv[1:]):
+        print(f'{PROG} {get_version()}')
+        raise SystemExit(0)
 
-    # store the app name and version in the config
-    senpai.config.set_value('prog', parser.prog)
-    senpai.config.set_value('version', get_version())
-    senpai.config.write()
+    # parse the arguments, falling back to argparse for the slow path
+    args = fast_parse(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
 
-    # set colors
-    color_chunks = (
-        'bold', 'bright', 'black', 'white', 'gray', 'red',
-        'green', 'yellow', 'blue', 'magenta', 'cyan',
-    )
+    # initialize bash senpai; imported lazily so the --help/--version and
+    # argument-error paths don't pay for the full dependency tree
+    from .senpai import BashSenpai
+    senpai = BashSenpai()
 
-    if args.command_color:
-        command_color = ' '.join(args.command_color)
-        command_color = command_color.lower().replace('grey', 'gray')
-        for chunk in command_color.split():
-            if not chunk in color_chunks:
-                print(f'Error! Can\'t parse "{chunk}".')
-                raise SystemExit(1)
-        senpai.config.set_value('command_color', command_color)
-        senpai.config.write()
-
-    if args.comment_color:
-        comment_color = ' '.join(args.comment_color)
-        comment_color = comment_color.lower().replace('grey', 'gray')
-        for chunk in comment_color.split():
-            if not chunk in color_chunks:
-                print(f'Error! Can\'t parse "{chunk}".')
-                raise SystemExit(1)
-        senpai.config.set_value('comment_color', comment_color)
-        senpai.config.write()
-
-    # whether to send OS metadata
-    if args.meta:
-        senpai.config.set_value('metadata', True)
-    else:
-        senpai.config.set_value('metadata', False)
-    senpai.config.write()
-
-    # whether to execute the provided commands
-    if args.run:
-        senpai.config.set_value('execute', True)
-    else:
-        senpai.config.set_value('execute', False)
-    senpai.config.write()
-
-    # clear the previous user history
-    if args.new:
-        senpai.history.clear()
-
-    # parse the prompt
-    if not args.prompt:
-        raise SystemExit(0)
+    try:
+        # store the app name and version in the config
+        senpai.config.set_value('prog', PROG)
+        senpai.config.set_value('version', get_version())
+
+        # set colors
+        if args.command_color:
+            color = parse_color_arg(args.command_color)
+            senpai.config.set_value('command_color', color)
+
+        if args.comment_color:
+            color = parse_color_arg(args.comment_color)
+            senpai.config.set_value('comment_color', color)
+
+        # whether to send OS metadata
+        if args.meta is not None:
+            senpai.config.set_value('metadata', bool(args.meta))
 
-    prompt = args.prompt[0]
-    if prompt == 'login':
-        if len(args.prompt) > 1:
-            print('Error! The "login" prompt takes no extra arguments.')
-            raise SystemExit(1)
+        # whether to execute the provided commands
+        if args.run is not None:
+            senpai.config.set_value('execute', bool(args.run))
 
-        # read the auth token from the stdin and send a login request
-        token = input('Auth token: ')
-        await senpai.login(token)
+        # the changed settings are flushed in one write at exit
+        senpai.api.refresh()
 
-    elif prompt == 'become':
-        if len(args.prompt) == 1:
-            print('Error! Please provide the persona you wish BashSenpai to use.')
-            raise SystemExit(1)
+        # clear the previous user history
+        if args.new:
+            senpai.history.clear()
 
-        persona = ' '.join(args.prompt[1:])
-        senpai.config.set_value('persona', persona)
-        senpai.config.write()
-        print('New persona confirmed.')
+        # parse the prompt
+        if not args.prompt:
+            raise SystemExit(0)
 
-    elif prompt == 'explain' and len(args.prompt) < 3:
-        if len(args.prompt) == 1:
-            print('Error! The "explain" prompt takes one extra argument in the form of a command name.')
-            raise SystemExit(1)
-        await senpai.explain(args.prompt[1])
+        prompt = args.prompt[0]
+        if prompt == 'login':
+            if len(args.prompt) > 1:
+                print('Error! The "login" prompt takes no extra arguments.')
+                raise SystemExit(1)
+
+            # read the auth token from the stdin and send a login request
+            token = input('Auth token: ')
+            await senpai.login(token)
 
-    else:
-        question = ' '.join(args.prompt)
-        await senpai.ask_question(question)
+        elif prompt == 'become':
+            if len(args.prompt) == 1:
+                print('Error! Please provide the persona you wish BashSenpai to use.')
+                raise SystemExit(1)
+
+            persona = ' '.join(args.prompt[1:])
+            senpai.config.set_value('persona', persona)
+            senpai.api.refresh()
+            print('New persona confirmed.')
+
+        elif prompt == 'explain' and len(args.prompt) < 3:
+            if len(args.prompt) == 1:
+                print('Error! The "explain" prompt takes one extra argument in the form of a command name.')
+                raise SystemExit(1)
+            await senpai.explain(args.prompt[1])
+
+        else:
+            question = ' '.join(args.prompt)
+            await senpai.ask_question(question)
+    finally:
+        # release the pooled API connections before the loop closes
+        await senpai.api.aclose()
 
 
 def main():
     """Runs the CLI in async mode."""
+    import asyncio
+
+    # use the faster libuv-backed event loop where available
+    if sys.platform not in ('win32', 'cygwin'):
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     asyncio.run(run())
 
 
@@ -13,14 +13,15 @@
 # limitations under the License.
 
 import asyncio
+import atexit
+from contextlib import suppress
 from datetime import datetime
-import json
+from functools import lru_cache
 import os
 from pathlib import Path
-import platform
-from requests import Response
+import re
 import sys
-from typing import Callable, Union
+from typing import AsyncIterator, Callable, Union
 
 from .api import API
 from .data.config import Config
@@ -29,13 +30,81 @@ from .lib.color import parse_color
 from .terminal import Terminal
 
 
-# default config storage based on OS type
-if sys.platform in ('win32', 'cygwin'):
-    CONFIG_BASE = Path(os.path.normpath(os.getenv('LOCALAPPDATA')))
-elif sys.platform in ('darwin',):
-    CONFIG_BASE = Path.home() / 'Library' / 'Application Support'
-else:  # linux, freebsd, etc.
-    CONFIG_BASE = Path.home() / '.config'
+# matches the distribution name in os-release with a single C-level scan
+_PRETTY_NAME = re.compile(rb'^PRETTY_NAME=["\']?(.*?)["\']?\s*$', re.M)
+
+
+@lru_cache(maxsize=1)
+def _system_metadata() -> dict[str, str]:
+    """
+    Probes the OS information to include with the prompt.
+
+    The result is cached for the lifetime of the process, as the platform
+    probes can be comparatively expensive and the OS doesn't change between
+    calls.
+
+    Returns:
+        dict: Dictionary containing the user system metadata.
+    """
+    # deferred: only the metadata probe needs it, and only once per process
+    import platform
+
+    metadata = dict()
+
+    if sys.platform in ('win32', 'cygwin'):  # windows
+        metadata['os'] = 'Windows'
+        # getwindowsversion is a plain syscall, unlike win32_ver which
+        # goes through the registry; fall back only if it yields nothing
+        try:
+            winver = sys.getwindowsversion()
+            metadata['version'] = f'{winver.major}.{winver.minor}.{winver.build}'
+        except AttributeError:
+            metadata['version'] = platform.win32_ver()[0]
+
+    elif sys.platform in ('darwin',):  # macos
+        mac_ver = platform.mac_ver()
+        metadata['os'] = 'macOS'
+        metadata['version'] = mac_ver[0]
+        metadata['arch'] = mac_ver[-1]
+        metadata['shell'] = os.environ.get('SHELL', None)
+
+    else:  # linux, freebsd, etc.
+        metadata['os'] = 'Linux'
+        metadata['version'] = None
+
+        # raw-parse os-release as python 3.9 lacks freedesktop_os_release
+        os_release_path = Path('/etc/os-release')
+        if not os_release_path.exists():
+            os_release_path = Path('/usr/lib/os-release')
+            if not os_release_path.exists():
+                os_release_path = None
+
+        if os_release_path:
+            match = _PRETTY_NAME.search(os_release_path.read_bytes())
+            if match:
+                metadata['version'] = match.group(1).decode() or None
+
+        metadata['shell'] = os.environ.get('SHELL', None)
+
+    return metadata
+
+
+@lru_cache(maxsize=1)
+def _config_base() -> Path:
+    """
+    Returns the default config storage directory for the OS type.
+
+    Resolved lazily since Path.home() stats the passwd database; importing
+    the module stays free of filesystem work.
+
+    Returns:
+        Path: The base directory for application configuration.
+    """
+    if sys.platform in ('win32', 'cygwin'):
+        return Path(os.path.normpath(os.getenv('LOCALAPPDATA')))
+    if sys.platform in ('darwin',):
+        return Path.home() / 'Library' / 'Application Support'
+    return Path.home() / '.config'  # linux, freebsd, etc.
 
 
 class BashSenpai:
@@ -68,7 +137,6 @@ class BashSenpai:
         >>> senpai.explain('tar')
     """
 
-    CONFIG_DIR = CONFIG_BASE / 'senpai'
     DASHBOARD_URL = 'https://bashsenpai.com/dashboard'
 
     def __init__(self) -> None:
@@ -78,13 +146,20 @@ class BashSenpai:
         Creates the configuration directory if it doesn't exist and initializes
         the `config`, `history`, and `api` objects.
         """
-        # create config dir if it doesn't exist
-        path = Path(self.CONFIG_DIR)
-        path.mkdir(parents=True, exist_ok=True)
+        # create config dir if it doesn't exist; in the steady state a
+        # single stat confirms it and the mkdir chain is skipped
+        self.CONFIG_DIR = _config_base() / 'senpai'
+        if not self.CONFIG_DIR.is_dir():
+            self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
         self.config = Config(path=self.CONFIG_DIR)
         self.history = History(path=self.CONFIG_DIR)
 
+        # flush any buffered config and history once on interpreter exit;
+        # both writes are dirty-gated, so a steady-state run costs no I/O
+        atexit.register(self.config.write)
+        atexit.register(self.history.write)
+
         self.api = API(config=self.config, history=self.history)
 
         # parse colors
@@ -118,7 +193,7 @@ class BashSenpai:
 
         # if the response is a dict, it already contains an error
         if not isinstance(response, dict):
-            response = self._parse_response(response)
+            response = await self._parse_response(response)
 
         # check the response for errors
         self._handle_response_errors(response)
@@ -130,7 +205,6 @@ class BashSenpai:
             'persona': response.get('persona'),
             'timestamp': datetime.now().timestamp(),
         })
-        self.history.write()
 
         # if command execution is enabled, generate the menu and run it
         commands = response.get('commands')
@@ -157,7 +231,7 @@ class BashSenpai:
 
         # if the response is a dict, it already contains an error
         if not isinstance(response, dict):
-            response = self._parse_response(response)
+            response = await self._parse_response(response)
 
         # check the response for errors
         self._handle_response_errors(response)
@@ -190,9 +264,9 @@ class BashSenpai:
                 print(f'Visit {self.DASHBOARD_URL} to subscribe.')
             raise SystemExit(2)
 
-        # store the auth token in the config file
+        # store the auth token in the config, flushed on exit
         self.config.set_value('token', token)
-        self.config.write()
+        self.api.refresh()
 
         print('Authentication successful.')
 
@@ -200,7 +274,7 @@ class BashSenpai:
         self,
         prompt_fn: Callable,
         *args,
-    ) -> Union[Response, dict[str, str]]:
+    ) -> Union[AsyncIterator[dict], dict[str, str]]:
         """
         Animates the loading dots while waiting for the response.
 
@@ -209,19 +283,17 @@ class BashSenpai:
             *args: optional arguments to pass to the call
 
         Returns:
-            Response | dict[str, str]: An API call response or an error.
+            AsyncIterator | dict[str, str]: An API response stream or an
+                error.
         """
-        async def run_prompt():
-            global response
-            response = await prompt_fn(*args)
-            raise asyncio.CancelledError
-
-        tasks = (run_prompt(), self.terminal.show_loading(),)
+        loader = asyncio.create_task(self.terminal.show_loading())
         try:
-            await asyncio.gather(*tasks)
-        except asyncio.CancelledError:
+            return await prompt_fn(*args)
+        finally:
+            loader.cancel()
+            with suppress(asyncio.CancelledError):
+                await loader
             self.terminal.hide_loading()
-            return response
 
     def _check_version(self, latest_version: str) -> None:
         """
@@ -246,42 +318,7 @@ class BashSenpai:
         if not self.config.get_value('metadata'):
             return None
 
-        metadata = dict()
-
-        if sys.platform in ('win32', 'cygwin'):  # windows
-            metadata['os'] = 'Windows'
-            metadata['version'] = platform.win32_ver()[0]
-
-        elif sys.platform in ('darwin',):  # macos
-            mac_ver = platform.mac_ver()
-            metadata['os'] = 'macOS'
-            metadata['version'] = mac_ver[0]
-            metadata['arch'] = mac_ver[-1]
-            metadata['shell'] = os.environ.get('SHELL', None)
-
-        else:  # linux, freebsd, etc.
-            metadata['os'] = 'Linux'
-            metadata['version'] = None
-
-            # raw-parse os-release as python 3.9 lacks freedesktop_os_release
-            os_release_path = Path('/etc/os-release')
-            if not os_release_path.exists():
-                os_release_path = Path('/usr/lib/os-release')
-                if not os_release_path.exists():
-                    os_release_path = None
-
-            if os_release_path:
-                with open(os_release_path) as f:
-                    os_release = f.read()
-
-                for line in os_release.splitlines():
-                    line = line.strip()
-                    if line.upper().startswith('PRETTY_NAME'):
-                        metadata['version'] = line.split('=')[1].strip('"\'')
-
-            metadata['shell'] = os.environ.get('SHELL', None)
-
-        return metadata
+        return dict(_system_metadata())
 
     def _handle_response_errors(self, response_data: dict[str, str]) -> None:
         """
@@ -309,7 +346,10 @@ class BashSenpai:
                 raise SystemExit(3)
             raise SystemExit(3)  # Unknown error
 
-    def _parse_response(self, response: Response) -> dict[str, str]:
+    async def _parse_response(
+        self,
+        response: AsyncIterator[dict],
+    ) -> dict[str, str]:
         """
         Parses the response received from the API.
 
@@ -317,22 +357,37 @@ class BashSenpai:
         dictionary with all parsed data. Otherwise returns the error.
 
         Args:
-            response (Response): The response object received from the API.
+            response (AsyncIterator[dict]): A stream of parsed response chunks
+                received from the API.
 
         Returns:
             dict: JSON data wtih all the parsed data from the response.
         """
         latest_version = None
         original_response = None
-        printed_response = ''
+        printed_parts = []
+
+        # batch writes until a line is complete, so a long streamed answer
+        # costs one syscall per line, not per token; bind the loop-invariant
+        # attributes to locals to keep the per-token work flat
+        write = sys.stdout.write
+        command_color = self.command_color
+        comment_color = self.comment_color
+        endline_color = self.endline_color
+        out = []
+
+        def flush_line() -> None:
+            if out:
+                write(''.join(out))
+                out.clear()
+            sys.stdout.flush()
 
         new_line = None
         new_line_text = ''
         new_line_type = None
+        line_start = True
         commands = list()
-        for chunk in response.iter_lines(chunk_size=None):
-            chunk = json.loads(chunk)
-
+        async for chunk in response:
             # check for errors
             if 'error' in chunk:
                 return chunk
@@ -351,7 +406,7 @@ class BashSenpai:
                 break
 
             if 'content' in chunk:
-                printed_response += chunk['content']
+                printed_parts.append(chunk['content'])
                 chunk = chunk['content']
                 if chunk == '\n':
                     new_line = True
@@ -359,41 +414,49 @@ class BashSenpai:
 
                 if new_line:
                     if new_line_text:
-                        print(self.endline_color)
+                        out.append(endline_color + '\n')
+                        flush_line()
                     if new_line_type == 'command':
                         commands.append(new_line_text)
                     new_line_text = ''
+                    line_start = True
 
                 new_line_text += chunk
-                # determine line type and separate commands
-                if new_line or chunk.startswith('>'):
-                    if chunk.startswith('$'):
+                # determine line type and separate commands, dispatching on
+                # the first character instead of repeated startswith calls
+                first = chunk[0] if chunk else ''
+                if new_line or first == '>':
+                    if first == '$':
                         new_line_type = 'command'
                         chunk = chunk.lstrip('$ ')
-                        print(self.command_color, end='')
-                    elif chunk.startswith('>'):
+                        out.append(command_color)
+                    elif first == '>':
                         new_line_type = 'command'
-                        print(self.comment_color, end='')
+                        out.append(comment_color)
                     else:
                         if new_line_type == 'command':
-                            print('')
-                        print(self.comment_color, end='')
+                            out.append('\n')
+                        out.append(comment_color)
                         new_line_type = 'comment'
 
-                # strip command indicator from new line and chunk
-                new_line_text = new_line_text.lstrip('$')
-                if new_line_text.startswith(' '):
-                    new_line_text = new_line_text.lstrip()
-                    chunk = chunk.lstrip()
+                # strip the command indicator, only while the line may still
+                # begin with a prefix; later tokens skip the stripping work
+                if line_start:
+                    new_line_text = new_line_text.lstrip('$')
+                    if new_line_text[:1] == ' ':
+                        new_line_text = new_line_text.lstrip()
+                        chunk = chunk.lstrip()
+                    if new_line_text:
+                        line_start = False
 
                 if new_line_text and chunk:
-                    print(chunk, end='')
-                    sys.stdout.flush()
+                    out.append(chunk)
 
                 new_line = False
-
+        flush_line()
         print('\n')
 
+        printed_response = ''.join(printed_parts)
         if original_response:
             return {
                 'version': latest_version,
@@ -13,13 +13,31 @@
 # limitations under the License.
 
 import asyncio
-import os
-import subprocess
+from itertools import cycle
+import shutil
+import signal
 import sys
 
 from .lib.user_input import readkey, readinput, BASE_KEYS, OS_KEYS
 
 
+# prompt prefixes with their on-screen widths; the emoji span two terminal
+# cells each, which a plain len() undercounts by one
+_RUN_PREFIX = '🚀 Run: '
+_RUN_PREFIX_WIDTH = len(_RUN_PREFIX) + 1
+_EDIT_PREFIX = '📝 Edit: '
+_EDIT_PREFIX_WIDTH = len(_EDIT_PREFIX) + 1
+
+# menu key dispatch table: one hash lookup per keypress resolves the action
+_KEYMAP = {
+    OS_KEYS.UP: 'up', 'k': 'up', 'K': 'up',
+    OS_KEYS.DOWN: 'down', 'j': 'down', 'J': 'down',
+    'e': 'edit', 'E': 'edit',
+    BASE_KEYS.SPACE: 'run', OS_KEYS.ENTER: 'run',
+    'q': 'quit', 'Q': 'quit', BASE_KEYS.CTRL_D: 'quit',
+}
+
+
 class Terminal:
     """
     An object that handles all terminal manipulations and the command execution
@@ -54,11 +72,79 @@ class Terminal:
         self.command_color = command_color
         self.comment_color = comment_color
 
-        self.terminal_size = os.get_terminal_size().columns
+        # pre-split color patterns so hot paths can concatenate directly
+        # instead of running the % formatter on every use
+        self.command_pre, self.command_post = command_color.split('%s')
+        self.comment_pre, self.comment_post = comment_color.split('%s')
+
+        # both render forms of each command row, filled in by show_menu
+        self._selected_fmt = command_color % '👉 %s'
+        self._other_fmt = comment_color % '   %s'
+        self._rows = []
+
+        self._run_prompt = command_color % _RUN_PREFIX
+        self._size_changed = False
+
+        self.terminal_size = shutil.get_terminal_size().columns
+        self._rebuild_size_cache()
+
+        # keep the cached width fresh via the resize signal where available,
+        # instead of re-querying the terminal size on every keypress
+        if hasattr(signal, 'SIGWINCH'):
+            signal.signal(signal.SIGWINCH, self._on_resize)
+
+    def _on_resize(self, signum, frame) -> None:
+        """Updates the cached terminal width when the window is resized."""
+        self.terminal_size = shutil.get_terminal_size().columns
+        self._rebuild_size_cache()
+        if getattr(self, 'commands', None):
+            self._build_rows()
+        self._size_changed = True
+
+    def _build_rows(self) -> None:
+        """Pre-renders every command row in its selected and unselected
+        forms, so a redraw is a cache lookup; rebuilt only when the command
+        list or the terminal width changes."""
+        width = self.terminal_size
+        rows = []
+        for command in self.commands:
+            # truncate longer commands
+            if len(command) > width - 5:
+                command = f'{command[:width - 8]}...'
+            rows.append((
+                (self._selected_fmt % command + '\n').encode(),
+                (self._other_fmt % command + '\n').encode(),
+            ))
+        self._rows = rows
+
+    def _rebuild_size_cache(self) -> None:
+        """Precomputes the separator and header strings for the current
+        terminal width."""
+        self._separator = self.comment_color % '—' * self.terminal_size
+        self._separator_b = (self._separator + '\n').encode()
+        self._header = '\n'.join((
+            self._separator,
+            self.command_color % '💬 ' + \
+            self.comment_color % 'Press ' + \
+            self.command_color % '[Enter]' + \
+            self.comment_color % ' to execute, ' + \
+            self.command_color % '[E]' + \
+            self.comment_color % ' to edit, or ' + \
+            self.command_color % '[Q]' + \
+            self.comment_color % ' to exit.',
+            self._separator,
+        ))
+
+    # move the cursor one line up and clear it
+    CLEAR_LINE = '\x1B[1A\x1B[2K\r'
+    CLEAR_LINE_B = CLEAR_LINE.encode()
+
+    # move the cursor up n lines and clear everything below in one sequence
+    CLEAR_LINES_B = b'\x1B[%dF\x1B[0J'
 
     def clear_line(self) -> None:
         """Clears any text from the last line in the console."""
-        print(f'\x1B[1A\x1B[2K\r', end='')
+        print(self.CLEAR_LINE, end='')
 
     def hide_loading(self) -> None:
         """Hide the loading message."""
@@ -75,33 +161,26 @@ class Terminal:
         # separate the output from the shell command with a single line
         print('')
 
-        # show the loading prompt
-        terminal_height = os.get_terminal_size().lines
+        # show the loading prompt; scroll down a full screen, then hop back
+        # up and wipe it with a single escape sequence instead of a
+        # clear-line write per row
+        terminal_height = shutil.get_terminal_size().lines
         print('\n' * (terminal_height - 1), end='')
-        for _ in range(terminal_height - 1):
-            self.clear_line()
+        sys.stdout.buffer.write(self.CLEAR_LINES_B % (terminal_height - 1))
 
-        # animate the dots...
-        i = 0
-        backwards = True
-        while True:
-            print(
-                self.comment_color % '⌛️ Your request is being processed',
-                end='',
-            )
-            if backwards:
-                print('.' * (2 - i))
-            else:
-                print('.' * (i + 1))
-            sys.stdout.flush()
-
-            i += 1
-            if i == 3:
-                backwards = not backwards
-                i = 0
+        # animate the dots, cycling through frames pre-encoded to bytes so
+        # each tick is a single unencoded write
+        message = self.comment_color % '⌛️ Your request is being processed'
+        frames = tuple(
+            (message + '.' * n + '\n').encode() for n in (2, 1, 0, 1, 2, 3)
+        )
+        out = sys.stdout.buffer
+        for frame in cycle(frames):
+            out.write(frame)
+            out.flush()
 
             await asyncio.sleep(0.55)
-            self.clear_line()
+            out.write(self.CLEAR_LINE_B)
 
     def show_menu(self, commands: list[str]) -> None:
         """
@@ -118,74 +197,132 @@ class Terminal:
         """
         self.commands = commands
         self.index = 0
+        self._build_rows()
 
         self._print_header()
         self._print_newlines()
 
+        # without a resize signal the width has to be polled each step
+        has_winch = hasattr(signal, 'SIGWINCH')
+
         self.extra_lines = 0
+        needs_redraw = True
         while True:
-            # get the terminal width on each step
-            self.terminal_size = os.get_terminal_size().columns
-
-            for _ in range(len(self.commands) + 2 + self.extra_lines):
-                self.clear_line()
-
-            for index, command in enumerate(self.commands):
-                # truncate longer commands
-                if len(command) > self.terminal_size - 5:
-                    command = f'{command[:self.terminal_size - 8]}...'
-
-                if index == self.index:
-                    print(self.command_color % f'👉 {command}')
-                else:
-                    print(self.comment_color % f'   {command}')
-
-            self._print_separator()
-
-            prompt_prefix = '🚀 Run: '
-            print(
-                self.command_color % prompt_prefix + \
-                self.comment_color % self.commands[self.index],
-            )
-
-            # extra lines to clear if the prompt goes on more lines
-            prompt_len = len(self.commands[self.index]) + len(prompt_prefix)
-            self.extra_lines = prompt_len // self.terminal_size
-
-            # handle user input
-            key = readkey()
-            if key in [OS_KEYS.UP, 'k', 'K']:
+            if not has_winch:
+                size = shutil.get_terminal_size().columns
+                if size != self.terminal_size:
+                    self.terminal_size = size
+                    self._rebuild_size_cache()
+                    self._build_rows()
+                    needs_redraw = True
+            if self._size_changed:
+                self._size_changed = False
+                needs_redraw = True
+
+            if needs_redraw:
+                # build the whole frame as bytes and draw it with a single
+                # write to the binary layer, skipping the per-write encode
+                frame = [
+                    self.CLEAR_LINES_B % (
+                        len(self.commands) + 2 + self.extra_lines
+                    ),
+                ]
+
+                for index, row in enumerate(self._rows):
+                    frame.append(row[0] if index == self.index else row[1])
+
+                frame.append(self._separator_b)
+
+                frame.append((
+                    self._run_prompt + self.comment_pre +
+                    self.commands[self.index] + self.comment_post + '\n'
+                ).encode())
+
+                sys.stdout.buffer.write(b''.join(frame))
+                sys.stdout.buffer.flush()
+
+                # extra lines to clear if the prompt goes on more lines
+                prompt_len = \
+                    len(self.commands[self.index]) + _RUN_PREFIX_WIDTH
+                self.extra_lines = prompt_len // self.terminal_size
+                needs_redraw = False
+
+            # handle user input; selection moves patch only the affected
+            # rows in place, everything else falls back to a full redraw
+            action = _KEYMAP.get(readkey())
+            if action == 'up':
                 if self.index > 0:
-                    self.index -= 1
-            elif key in [OS_KEYS.DOWN, 'j', 'J']:
+                    self._move_selection(self.index - 1)
+            elif action == 'down':
                 if self.index < len(self.commands) - 1:
-                    self.index += 1
-            elif key in ['e', 'E']:
+                    self._move_selection(self.index + 1)
+            elif action == 'edit':
                 self._edit_command()
-            elif key in [BASE_KEYS.SPACE, OS_KEYS.ENTER]:
+                self._build_rows()
+                needs_redraw = True
+            elif action == 'run':
                 self._execute_command()
+                self._build_rows()
+                needs_redraw = True
                 if self.commands:
                     self._print_header()
                     self._print_newlines()
-            elif key in ['q', 'Q', BASE_KEYS.CTRL_D]:
+            elif action == 'quit':
                 break
 
             if not self.commands:
                 break
 
+    def _move_selection(self, new_index: int) -> None:
+        """
+        Moves the selection marker by rewriting only the two affected command
+        rows and the run prompt in place.
+
+        An arrow keypress costs a constant number of terminal writes this
+        way, instead of repainting the whole frame.
+
+        Args:
+            new_index (int): The index of the newly selected command.
+        """
+        old_index = self.index
+        self.index = new_index
+        rows = len(self._rows)
+
+        parts = []
+        for index in (old_index, new_index):
+            # distance from the cursor (below the frame) up to the row
+            up = rows - index + 2 + self.extra_lines
+            parts.append(b'\x1B[%dA\x1B[2K\r' % up)
+            parts.append(
+                self._rows[index][0 if index == new_index else 1]
+            )
+            parts.append(b'\x1B[%dB' % (up - 1))
+
+        # rewrite the run prompt with the newly selected command
+        parts.append(self.CLEAR_LINES_B % (1 + self.extra_lines))
+        parts.append((
+            self._run_prompt + self.comment_pre +
+            self.commands[new_index] + self.comment_post + '\n'
+        ).encode())
+
+        sys.stdout.buffer.write(b''.join(parts))
+        sys.stdout.buffer.flush()
+
+        prompt_len = len(self.commands[new_index]) + _RUN_PREFIX_WIDTH
+        self.extra_lines = prompt_len // self.terminal_size
+
     def _edit_command(self) -> None:
         """Allows the user to edit the currently selected command."""
         for _ in range(1 + self.extra_lines):
             self.clear_line()
 
-        prompt_prefix = '📝 Edit: '
         self.commands[self.index] = readinput(
-            self.command_color % prompt_prefix,
+            self.command_color % _EDIT_PREFIX,
             self.commands[self.index],
         )
 
         # extra lines to clear if the prompt goes on more lines
-        prompt_len = len(self.commands[self.index]) + len(prompt_prefix)
+        prompt_len = len(self.commands[self.index]) + _EDIT_PREFIX_WIDTH
         self.extra_lines = prompt_len // self.terminal_size
 
     def _execute_command(self) -> None:
@@ -194,37 +331,25 @@ class Terminal:
         list.
         """
 
+        # deferred: subprocess is a heavy import and is only needed once
+        # the user actually executes a command from the menu
+        import subprocess
+
         # get current command
         command = self.commands.pop(self.index)
 
-        # execute the command and print the result
+        # execute the command with the terminal's own stdout/stderr, so the
+        # output streams as it's produced instead of buffering in memory
+        print('')
+        subprocess.run(command, shell=True)
         print('')
-        command_result = subprocess.run(
-            command,
-            shell=True, capture_output=True, text=True,
-        )
-        if len(command_result.stdout.strip()):
-            print(command_result.stdout)
-        elif len(command_result.stderr.strip()):
-            print(command_result.stderr)
 
         if self.index > 0:
             self.index -= 1
 
     def _print_header(self) -> None:
         """Prints the header of the menu."""
-        self._print_separator()
-        print(
-            self.command_color % '💬 ' + \
-            self.comment_color % 'Press ' + \
-            self.command_color % '[Enter]' + \
-            self.comment_color % ' to execute, ' + \
-            self.command_color % '[E]' + \
-            self.comment_color % ' to edit, or ' + \
-            self.command_color % '[Q]' + \
-            self.comment_color % ' to exit.'
-        )
-        self._print_separator()
+        print(self._header)
 
     def _print_newlines(self) -> None:
         """Prints the new lines for a new menu prompt."""
@@ -232,4 +357,4 @@ class Terminal:
 
     def _print_separator(self) -> None:
         """Prints a line separator."""
-        print(self.comment_color % '—' * self.terminal_size)
+        print(self._separator)
@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
 from setuptools import setup, find_packages
 
-from senpai.main import get_version
+
+def get_version():
+    # read the version textually so the build doesn't import the package
+    with open('senpai/__init__.py') as f:
+        return re.search(r"__version__ = '([^']+)'", f.read()).group(1)
 
 
 def readme():
@@ -31,7 +37,13 @@ setup(
     author='Bogdan Tatarov',
     author_email='bogdan@tatarov.me',
     license='Apache-2.0',
-    install_requires=('requests', 'toml'),
+    install_requires=(
+        'aiohttp',
+        'orjson',
+        'tomli; python_version < "3.11"',
+        'tomli_w',
+        'uvloop; platform_system != "Windows"',
+    ),
     packages=find_packages(),
     entry_points=dict(
         console_scripts=['senpai=senpai.main:main']
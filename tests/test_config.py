@@ -0,0 +1,34 @@
+# Copyright 2023 Bogdan Tatarov
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+pytest.importorskip('tomli_w')
+
+from senpai.data.config import Config
+
+
+def test_logged_out_write_reload_round_trip(tmp_path):
+    """A config with an unset token (the logged-out default) must survive a
+    write/reload cycle, with None-valued settings omitted from the file."""
+    config = Config(path=tmp_path)
+    assert config.get_value('token') is None
+
+    config.set_value('version', '0.95')
+    config.write()
+
+    reloaded = Config(path=tmp_path)
+    assert reloaded.get_value('token') is None
+    assert reloaded.get_value('version') == '0.95'
+    assert reloaded.get_value('persona') == 'default'